@@ -1,8 +1,9 @@
 import streamlit as st
-import statistics
-from collections import Counter
 import math
 
+# Heavy optional modules (NumPy, plotting, file readers) are imported inside
+# the branch that uses them, not here, so a session pays only for what it renders.
+
 st.title("📊 Mean, Median, Mode Calculator (Grouped & Individual Data with Detailed Steps)")
 
 st.sidebar.header("📝 Instructions")
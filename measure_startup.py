@@ -0,0 +1,199 @@
+"""Measure cold-start time and per-session memory of app.py
+
+Usage:
+    python measure_startup.py                 # 5 runs, 16 steps of 10 sessions
+    python measure_startup.py --runs 3 --sessions 20 --steps 10
+
+With the defaults a full run takes roughly 20 minutes.
+
+Sessions are rendered with Streamlit's AppTest harness, which runs app.py
+the way `streamlit run` does but without a browser. Every figure is
+reported for two scenarios:
+    grouped     the default page (Grouped Data, Mean)
+    individual  "Individual Data" selected on the input-mode radio, then rerun
+
+Cold start: every run launches a fresh Python process that renders one
+session, so nothing is shared between runs.
+    process_s   wall time of the whole child process, timed by the parent:
+                interpreter startup, importing streamlit and the AppTest
+                harness, and rendering the page
+    render_s    time inside the child to render the page (AppTest run)
+    rss_kb      resident memory of the child after rendering
+
+Per-session memory: a child renders one session to warm up imports and
+caches, opens N sessions and samples memory, then keeps opening N more
+sessions and sampling again, keeping every session alive. Each step
+gives a slope (sample after step - sample before step) / N, and the
+figure is the median slope over all steps. Starting from the first N
+sessions leaves out one-time growth. Taking the median over many steps
+rides out the allocator: resident memory rises in a sawtooth, with drops
+every few dozen sessions, so the slope of any single step (or of one
+N -> 2N pair) depends on where it falls and can even be negative.
+    rss_kb      resident memory (VmRSS), tracing off, --steps steps
+    py_heap_kb  Python-heap share only, from a separate child with
+                tracemalloc on, --heap-steps steps. It does not see native
+                buffers (pandas, pyarrow, protobuf). Tracing makes each
+                render about 4x slower, and the heap grows smoothly apart
+                from rare one-off jumps that the median skips, so fewer
+                steps are enough.
+
+Each figure is the median of --runs child processes.
+
+Resident memory is read from /proc/self/status, so this script needs Linux.
+"""
+import argparse
+import gc
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+SCENARIOS = ["grouped", "individual"]
+
+
+def rss_kb():
+    """Current resident set size of this process in KB"""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    raise SystemExit("Reading resident memory needs /proc/self/status (Linux)")
+
+
+def render(scenario):
+    """Render one session of app.py for the given scenario and return it"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=60).run()
+    if scenario == "individual":
+        mode = next(r for r in at.radio if r.label == "Select Data Input Mode:")
+        mode.set_value("Individual Data").run()
+    if at.exception:
+        raise SystemExit(f"app.py raised: {at.exception}")
+    return at
+
+
+def open_sessions(scenario, sessions):
+    """Open N sessions and return them so they all stay alive"""
+    alive = [render(scenario) for _ in range(sessions)]
+    gc.collect()
+    return alive
+
+
+def cold_start(scenario):
+    """Runs in a fresh child process: render one session"""
+    from streamlit.testing.v1 import AppTest  # noqa: F401  keep import out of render_s
+
+    start = time.perf_counter()
+    render(scenario)
+    print(json.dumps({
+        "render_s": time.perf_counter() - start,
+        "rss_kb": rss_kb(),
+    }))
+
+
+def slope_per_session(scenario, sessions, steps, sample):
+    """Median per-session slope of sample() over steps of N new live sessions"""
+    alive = open_sessions(scenario, 1) + open_sessions(scenario, sessions)
+    before = sample()
+    slopes = []
+    for _ in range(steps):
+        alive += open_sessions(scenario, sessions)
+        after = sample()
+        slopes.append((after - before) / sessions)
+        before = after
+    return statistics.median(slopes)
+
+
+def per_session_rss(scenario, sessions, steps):
+    """Resident memory per extra live session, with tracing off"""
+    print(json.dumps({"rss_kb": slope_per_session(scenario, sessions, steps, rss_kb)}))
+
+
+def per_session_heap(scenario, sessions, steps):
+    """Python heap per extra live session, as seen by tracemalloc"""
+    import tracemalloc
+
+    tracemalloc.start()
+    heap_kb = slope_per_session(
+        scenario, sessions, steps,
+        lambda: tracemalloc.get_traced_memory()[0] / 1024,
+    )
+    tracemalloc.stop()
+    print(json.dumps({"py_heap_kb": heap_kb}))
+
+
+def run_child(*args):
+    """Run this script as a child and return its JSON result and wall time"""
+    start = time.perf_counter()
+    child = subprocess.run(
+        [sys.executable, __file__, *args],
+        capture_output=True, text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if child.returncode != 0:
+        sys.stderr.write(child.stderr)
+        raise SystemExit(f"measurement child {args} exited with {child.returncode}")
+    result = json.loads(child.stdout.strip().splitlines()[-1])
+    result["process_s"] = elapsed
+    return result
+
+
+def median(runs, key):
+    return statistics.median(r[key] for r in runs)
+
+
+def spread(runs, key):
+    values = [r[key] for r in runs]
+    return f"{min(values):.1f}-{max(values):.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="child processes per figure")
+    parser.add_argument("--sessions", type=int, default=10, help="sessions opened per step")
+    parser.add_argument("--steps", type=int, default=16, help="steps measured for rss_kb")
+    parser.add_argument("--heap-steps", type=int, default=4, help="steps measured for py_heap_kb")
+    parser.add_argument("--child", choices=["cold", "rss", "heap"], help=argparse.SUPPRESS)
+    parser.add_argument("--scenario", choices=SCENARIOS, default="grouped", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child == "cold":
+        cold_start(args.scenario)
+        return
+    if args.child == "rss":
+        per_session_rss(args.scenario, args.sessions, args.steps)
+        return
+    if args.child == "heap":
+        per_session_heap(args.scenario, args.sessions, args.steps)
+        return
+
+    sessions = ["--sessions", str(args.sessions)]
+    for scenario in SCENARIOS:
+        scenario_args = ["--scenario", scenario]
+        cold = [run_child("--child", "cold", *scenario_args) for _ in range(args.runs)]
+        rss = [run_child("--child", "rss", *scenario_args, *sessions, "--steps", str(args.steps))
+               for _ in range(args.runs)]
+        heap = [run_child("--child", "heap", *scenario_args, *sessions, "--steps", str(args.heap_steps))
+                for _ in range(args.runs)]
+
+        print(f"[{scenario}] cold start (median of {args.runs} runs):")
+        print(f"  process_s    {median(cold, 'process_s'):.3f}")
+        print(f"  render_s     {median(cold, 'render_s'):.3f}")
+        print(f"  rss_kb       {median(cold, 'rss_kb'):.0f}")
+        print(f"[{scenario}] per extra session ({args.sessions} sessions per step, "
+              f"median of {args.runs} runs):")
+        print(f"  rss_kb       {median(rss, 'rss_kb'):.1f}   (resident memory, tracing off; "
+              f"runs {spread(rss, 'rss_kb')})")
+        print(f"  py_heap_kb   {median(heap, 'py_heap_kb'):.1f}   (Python heap only, tracemalloc; "
+              f"runs {spread(heap, 'py_heap_kb')})")
+
+
+if __name__ == "__main__":
+    main()